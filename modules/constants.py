@@ -1,3 +1,4 @@
+import itertools
 import os
 
 APP_NAME = "Specific Tool"
@@ -28,9 +29,33 @@ FONT_BODY = ("Arial", 13)
 FONT_SMALL = ("Arial", 11)
 
 # Hex Data for VXE MAD R
+# Packets are stored as bytes so hid.device.write() memcpys them in one shot
+# instead of coercing a Python int list element-by-element per send.
 
 
-CMD_HZ_2000 = [0x08,0x07,0x00,0x00,0x00,0x06,0x10,0x45,0x04,0x51,0x01,0x54,0x00,0x00,0x00,0x00,0x41]
-CMD_HZ_1000 = [0x08,0x07,0x00,0x00,0x00,0x06,0x01,0x54,0x04,0x51,0x01,0x54,0x00,0x00,0x00,0x00,0x41]
-SEQ_DPI_1600 = [[0x08,0x07,0x00,0x00,0x0c,0x08,0x07,0x07,0x00,0x47,0x1f,0x1f,0x00,0x17,0x00,0x00,0x88],[0x08,0x07,0x00,0x00,0x14,0x08,0x1f,0x1f,0x00,0x17,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x80],[0x08,0x07,0x00,0x00,0x1c,0x08,0x3f,0x3f,0x00,0xd7,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x78],[0x08,0x07,0x00,0x00,0x24,0x08,0x3f,0x3f,0x00,0xd7,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x70]]
-SEQ_DPI_800 = [[0x08,0x07,0x00,0x00,0x0c,0x08,0x07,0x07,0x00,0x47,0x0f,0x0f,0x00,0x37,0x00,0x00,0x88],[0x08,0x07,0x00,0x00,0x14,0x08,0x1f,0x1f,0x00,0x17,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x80],[0x08,0x07,0x00,0x00,0x1c,0x08,0x3f,0x3f,0x00,0xd7,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x78],[0x08,0x07,0x00,0x00,0x24,0x08,0x3f,0x3f,0x00,0xd7,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x70]]
+CMD_HZ_2000 = bytes([0x08,0x07,0x00,0x00,0x00,0x06,0x10,0x45,0x04,0x51,0x01,0x54,0x00,0x00,0x00,0x00,0x41])
+CMD_HZ_1000 = bytes([0x08,0x07,0x00,0x00,0x00,0x06,0x01,0x54,0x04,0x51,0x01,0x54,0x00,0x00,0x00,0x00,0x41])
+SEQ_DPI_1600 = tuple(bytes(p) for p in (
+    [0x08,0x07,0x00,0x00,0x0c,0x08,0x07,0x07,0x00,0x47,0x1f,0x1f,0x00,0x17,0x00,0x00,0x88],
+    [0x08,0x07,0x00,0x00,0x14,0x08,0x1f,0x1f,0x00,0x17,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x80],
+    [0x08,0x07,0x00,0x00,0x1c,0x08,0x3f,0x3f,0x00,0xd7,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x78],
+    [0x08,0x07,0x00,0x00,0x24,0x08,0x3f,0x3f,0x00,0xd7,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x70],
+))
+SEQ_DPI_800 = tuple(bytes(p) for p in (
+    [0x08,0x07,0x00,0x00,0x0c,0x08,0x07,0x07,0x00,0x47,0x0f,0x0f,0x00,0x37,0x00,0x00,0x88],
+    [0x08,0x07,0x00,0x00,0x14,0x08,0x1f,0x1f,0x00,0x17,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x80],
+    [0x08,0x07,0x00,0x00,0x1c,0x08,0x3f,0x3f,0x00,0xd7,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x78],
+    [0x08,0x07,0x00,0x00,0x24,0x08,0x3f,0x3f,0x00,0xd7,0x3f,0x3f,0x00,0xd7,0x00,0x00,0x70],
+))
+
+# Contiguous send-side layout: each sequence is flattened into one blob plus
+# an offset table, so the write loop slices zero-copy memoryviews instead of
+# dereferencing one bytes object per packet. Porters only need to edit the
+# SEQ_DPI_* tuples above; these derive from them.
+def _pack_seq(packets):
+    blob = b"".join(packets)
+    offs = tuple(itertools.accumulate(map(len, packets), initial=0))
+    return blob, offs
+
+SEQ_DPI_1600_BLOB, SEQ_DPI_1600_OFFS = _pack_seq(SEQ_DPI_1600)
+SEQ_DPI_800_BLOB, SEQ_DPI_800_OFFS = _pack_seq(SEQ_DPI_800)
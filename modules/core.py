@@ -6,6 +6,8 @@ import shutil
 from pathlib import Path
 import winreg
 import time
+import queue
+import threading
 import psutil
 import win32gui
 import win32process
@@ -106,13 +108,19 @@ class ConfigManager:
     """
     def __init__(self):
         self.path = CONFIG_FILE
+        # save() may be called from the UI, automation and save-worker
+        # threads; serialize the actual file write.
+        self._io_lock = threading.Lock()
         self.games: List[str] = []
         self.settings: Dict[str, Any] = {
-            "start_in_tray": False, 
-            "single_monitor": True, 
+            "start_in_tray": False,
+            "single_monitor": True,
             "startup": False,
             "murqin_mode": False
         }
+        # True when what we loaded no longer matches what save() would write
+        # (legacy schema, corrupt file) and the file should be rewritten.
+        self._dirty = False
         self._load()
 
     @property
@@ -129,19 +137,23 @@ class ConfigManager:
         try:
             with open(self.path, "r") as f:
                 data = json.load(f)
-                if isinstance(data, list): self.games = data
+                if isinstance(data, list):
+                    self.games = data
+                    self._dirty = True  # Legacy list-only schema, rewrite
                 else:
                     self.games = data.get("games", [])
                     self.settings.update(data.get("settings", {}))
         except json.JSONDecodeError:
             logger.error("Settings file is corrupted. Using defaults.")
+            self._dirty = True
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
 
     def save(self):
-        if not os.path.exists(os.path.dirname(self.path)): os.makedirs(os.path.dirname(self.path))
-        with open(self.path, "w") as f:
-            json.dump({"games": self.games, "settings": self.settings}, f)
+        with self._io_lock:
+            if not os.path.exists(os.path.dirname(self.path)): os.makedirs(os.path.dirname(self.path))
+            with open(self.path, "w") as f:
+                json.dump({"games": self.games, "settings": self.settings}, f)
 
 class ProcessMonitor:
     """
@@ -229,12 +241,68 @@ class AutomationEngine:
                 logger.error(f"Automation loop error: {e}")
             time.sleep(0.5)
 
+class HardwareWorker:
+    """
+    Owns blocking hardware calls on a dedicated thread.
+
+    UI handlers enqueue commands and return immediately, so HID writes and
+    NVAPI driver calls never stall the Tk mainloop. Bursts of queued
+    vibrance commands (one per slider pixel) are coalesced to the newest.
+    """
+    # One display frame: vibrance events landing within this window collapse
+    # into a single driver call, so a drag costs ~60 calls/s at most.
+    _VIB_WINDOW = 0.016
+
+    def __init__(self, mouse: IMouseBackend, gpu: IGPUBackend, os_mouse: IOSMouseService):
+        self.mouse, self.gpu, self.os_mouse = mouse, gpu, os_mouse
+        self._queue = queue.SimpleQueue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, *cmd):
+        """Queues a command tuple, e.g. ('vibrance', level, primary_only)."""
+        self._queue.put(cmd)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while True: batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            # If a slider drag is in flight, hold one frame for stragglers so
+            # the window's events become one call instead of one per pixel.
+            if batch[-1][0] == 'vibrance':
+                try:
+                    batch.append(self._queue.get(timeout=self._VIB_WINDOW))
+                    while True: batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    pass
+            last_vib = max((i for i, c in enumerate(batch) if c[0] == 'vibrance'), default=-1)
+            for i, cmd in enumerate(batch):
+                if cmd[0] == 'vibrance' and i != last_vib: continue
+                try:
+                    self._dispatch(cmd)
+                except Exception as e:
+                    logger.error(f"Hardware worker error ({cmd[0]}): {e}")
+
+    def _dispatch(self, cmd):
+        kind = cmd[0]
+        if kind == 'game_mode': self.mouse.set_game_mode()
+        elif kind == 'desktop_mode': self.mouse.set_desktop_mode()
+        elif kind == 'vibrance': self.gpu.set_vibrance(cmd[1], cmd[2])
+        elif kind == 'os_reset': self.os_mouse.reset()
+        elif kind == 'call': cmd[1]()  # Arbitrary hardware-touching callable
+
 class SafetyProtocol:
     def __init__(self, mouse: IMouseBackend, gpu: IGPUBackend, os_mouse: IOSMouseService, ui_provider):
         self.mouse, self.gpu, self.os_mouse, self.ui = mouse, gpu, os_mouse, ui_provider
         self._executed = False
         atexit.register(self.execute)
 
+    def rearm(self):
+        """Allows execute() to run again after a manual stop consumed it."""
+        self._executed = False
+
     def execute(self):
         if self._executed: return
         self._executed = True
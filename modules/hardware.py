@@ -1,16 +1,69 @@
 # modules/hardware.py
+import bisect
 import ctypes
+from ctypes import wintypes
 import hid
 import os
-import struct
+import sys
 import time
 import logging
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from .constants import CMD_HZ_2000, CMD_HZ_1000, SEQ_DPI_1600, SEQ_DPI_800
+from .constants import (
+    CMD_HZ_2000, CMD_HZ_1000,
+    SEQ_DPI_1600_BLOB, SEQ_DPI_1600_OFFS,
+    SEQ_DPI_800_BLOB, SEQ_DPI_800_OFFS,
+)
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; every NvidiaService instance shares the same DLL
+# handle so repeated construction never re-enters the Windows loader lock.
+_NVAPI_DLL = 'nvapi.dll' if sys.maxsize <= 2**32 else 'nvapi64.dll'
+_NVAPI_PATH = os.path.join(os.environ.get('SystemRoot', 'C:\\Windows'), 'System32', _NVAPI_DLL)
+_NVAPI_FTYPE = ctypes.WINFUNCTYPE if sys.maxsize <= 2**32 else ctypes.CFUNCTYPE
+_nvapi_dll_handle = None
+
+def _load_nvapi():
+    global _nvapi_dll_handle
+    if _nvapi_dll_handle is None and os.path.exists(_NVAPI_PATH):
+        _nvapi_dll_handle = ctypes.windll.LoadLibrary(_NVAPI_PATH)
+    return _nvapi_dll_handle
+
+class _GUID(ctypes.Structure):
+    _fields_ = [("Data1", wintypes.DWORD), ("Data2", wintypes.WORD),
+                ("Data3", wintypes.WORD), ("Data4", ctypes.c_ubyte * 8)]
+
+# HID device interface class {4D1E55B2-F16F-11CF-88CB-001111000030}
+_HID_GUID = _GUID(0x4D1E55B2, 0xF16F, 0x11CF,
+                  (ctypes.c_ubyte * 8)(0x88, 0xCB, 0x00, 0x11, 0x11, 0x00, 0x00, 0x30))
+_CM_PRESENT = 0x00000001  # CM_GET_DEVICE_INTERFACE_LIST_PRESENT
+
+def _present_hid_paths() -> Optional[List[bytes]]:
+    """
+    Lists all present HID interface paths via cfgmgr32.
+
+    Unlike hid.enumerate, this is a single buffer query — hidapi opens every
+    candidate device to read its strings, which can take >1s on crowded
+    systems. Returns utf-8 path bytes, or None if cfgmgr32 is unavailable
+    so callers can fall back to hid.enumerate.
+    """
+    try:
+        cm = ctypes.windll.cfgmgr32
+        size = wintypes.ULONG(0)
+        if cm.CM_Get_Device_Interface_List_SizeW(
+                ctypes.byref(size), ctypes.byref(_HID_GUID), None, _CM_PRESENT) != 0:
+            return None
+        if size.value <= 1: return []
+        buf = ctypes.create_unicode_buffer(size.value)
+        if cm.CM_Get_Device_Interface_ListW(
+                ctypes.byref(_HID_GUID), None, buf, size, _CM_PRESENT) != 0:
+            return None
+        # REG_MULTI_SZ: NUL-separated paths, double-NUL terminated.
+        return [s.encode('utf-8') for s in buf[:].split('\x00') if s]
+    except Exception:
+        return None
+
 # --- Abstract Interfaces ---
 class IMouseBackend(ABC):
     """Abstract base class for Mouse Hardware Backends."""
@@ -48,38 +101,73 @@ class VXEMouseBackend(IMouseBackend):
     on-board profile switching.
     """
     VENDOR_ID, PRODUCT_ID = 0x373B, 0x1040
+    _VIDPID = b"vid_%04x&pid_%04x" % (VENDOR_ID, PRODUCT_ID)
+    # Full-speed HID endpoints poll at 1ms (bInterval); the endpoint paces
+    # back-to-back writes itself, so one sleep covering the whole burst is
+    # enough instead of a fixed 20ms gap per packet.
+    _PACKET_INTERVAL = 0.001
+    # Minimum the firmware needs to commit a DPI sequence before accepting
+    # the polling-rate command.
+    _SETTLE_DELAY = 0.05
+    # Last interface path that opened successfully, shared across instances so
+    # reconnects skip the device-tree walk (hid.enumerate can take >1s on Windows).
+    _cached_path: Optional[bytes] = None
     def __init__(self): self.device = None
-    
+
     def connect(self) -> bool:
+        if self._cached_path and self._open_path(self._cached_path):
+            return True
         try:
+            # Preferred route: one cfgmgr32 buffer query instead of hidapi's
+            # open-every-device enumeration walk.
+            paths = _present_hid_paths()
+            if paths is not None:
+                for raw in paths:
+                    if self._match_interface(raw) and self._open_path(raw):
+                        type(self)._cached_path = raw
+                        return True
+                return False
             for d in hid.enumerate(self.VENDOR_ID, self.PRODUCT_ID):
-                path = d['path'].decode('utf-8','ignore').lower()
-                if "mi_01" in path and "col05" in path:  # Channel & interface
-                    self.device = hid.device()
-                    self.device.open_path(d['path'])
-                    self.device.set_nonblocking(1)
+                raw = d['path']
+                if self._match_interface(raw) and self._open_path(raw):
+                    type(self)._cached_path = raw
                     return True
             return False
         except Exception as e:
             logger.error(f"VXE Mouse connect error: {e}")
             return False
 
-    def _send(self, data):
-        if self.device:
-            try: self.device.write(data)
-            except Exception as e: logger.error(f"VXE Mouse send error: {e}")
+    def _match_interface(self, raw: bytes) -> bool:
+        path = raw.lower()
+        # VID/PID plus channel & interface (config collection on mi_01/col05)
+        return self._VIDPID in path and b"mi_01" in path and b"col05" in path
 
-    def set_game_mode(self):
-        if not self.device: return
-        for p in SEQ_DPI_1600: self._send(p); time.sleep(0.02)
-        time.sleep(0.25)
-        self._send(CMD_HZ_2000)
+    def _open_path(self, path: bytes) -> bool:
+        try:
+            dev = hid.device()
+            dev.open_path(path)
+            self.device = dev
+            return True
+        except (OSError, IOError, ValueError):
+            type(self)._cached_path = None
+            return False
 
-    def set_desktop_mode(self):
+    def _apply_profile(self, blob: bytes, offs, hz_cmd: bytes):
+        """Writes a DPI packet burst back-to-back, lets it settle, then sets the polling rate."""
         if not self.device: return
-        for p in SEQ_DPI_800: self._send(p); time.sleep(0.02)
-        time.sleep(0.25)
-        self._send(CMD_HZ_1000)
+        try:
+            write = self.device.write
+            mv = memoryview(blob)
+            n = len(offs) - 1
+            for i in range(n): write(mv[offs[i]:offs[i + 1]])
+            time.sleep(n * self._PACKET_INTERVAL + self._SETTLE_DELAY)
+            write(hz_cmd)
+        except Exception as e:
+            logger.error(f"VXE Mouse send error: {e}")
+
+    def set_game_mode(self): self._apply_profile(SEQ_DPI_1600_BLOB, SEQ_DPI_1600_OFFS, CMD_HZ_2000)
+
+    def set_desktop_mode(self): self._apply_profile(SEQ_DPI_800_BLOB, SEQ_DPI_800_OFFS, CMD_HZ_1000)
 
 class NvidiaService(IGPUBackend):
     """
@@ -93,61 +181,105 @@ class NvidiaService(IGPUBackend):
     - 0x9ABDD40D: nvapi_EnumDisplayHandle (Enumerates active displays)
     - 0x172409B4: nvapi_SetDVCLevel (Sets Digital Vibrance Control level)
     """
+    # Slider level (0..100) -> clamped DVC value, precomputed so set_vibrance
+    # does a single byte load instead of FP math + min/max per UI event.
+    # Stored +64-biased to keep the bytes table unsigned.
+    _DVC_TABLE = bytes(max(-63, min(63, int((lv - 50) * 1.26))) + 64 for lv in range(101))
+
     def __init__(self):
+        # Defers the heavy work (LoadLibrary + display enumeration) until the
+        # first availability check so constructing the service is free at startup.
         self._nvapi, self._handles, self._is_avail = None, [], False
-        self._init_api()
+        self._initialized = False
+        # Last successfully applied (level, primary_only); slider drags emit
+        # streams of repeated values that can be dropped without a driver call.
+        self._last_key = None
+
+    def _ensure_init(self):
+        if not self._initialized:
+            self._initialized = True
+            self._init_api()
 
     def _init_api(self):
         try:
-            sys_root = os.environ.get('SystemRoot', 'C:\\Windows')
-            bits = struct.calcsize("P") * 8
-            dll = 'nvapi.dll' if bits == 32 else 'nvapi64.dll'
-            path = os.path.join(sys_root, 'System32', dll)
-            if os.path.exists(path):
-                self._nvapi = ctypes.windll.LoadLibrary(path)
-                ftype = ctypes.WINFUNCTYPE if bits == 32 else ctypes.CFUNCTYPE
+            self._nvapi = _load_nvapi()
+            if self._nvapi is not None:
+                ftype = _NVAPI_FTYPE
                 q_int = self._nvapi.nvapi_QueryInterface
                 q_int.restype = ctypes.c_void_p
                 q_int.argtypes = [ctypes.c_int]
-                get = lambda id, args: ftype(ctypes.c_int, *args)(q_int(id))
-                
-                if get(0x0150E828, [])() == 0: # Init
-                    enum = get(0x9ABDD40D, [ctypes.c_int, ctypes.POINTER(ctypes.c_int)])
-                    self._set_dvc = get(0x172409B4, [ctypes.c_int, ctypes.c_int, ctypes.c_int])
-                    for i in range(10):
-                        h = ctypes.c_int(0)
-                        if enum(i, ctypes.byref(h)) == 0: self._handles.append(h)
-                        else: break
+                # Prototypes with fully declared signatures, built once here.
+                # The resulting wrappers are cached on the instance, so later
+                # calls (slider drags hit _set_dvc per handle) skip ctypes'
+                # per-argument type inference entirely.
+                proto_init = ftype(ctypes.c_int)
+                proto_enum = ftype(ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_int))
+                proto_dvc = ftype(ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int)
+
+                if proto_init(q_int(0x0150E828))() == 0: # Init
+                    enum = proto_enum(q_int(0x9ABDD40D))
+                    self._set_dvc = proto_dvc(q_int(0x172409B4))
+                    # One reused c_int + byref for the whole probe; snapshot
+                    # each handle value since NVAPI returns END_ENUMERATION
+                    # after the last display anyway.
+                    h = ctypes.c_int(0)
+                    byref_h = ctypes.byref(h)
+                    for i in range(16):
+                        if enum(i, byref_h) != 0: break
+                        self._handles.append(ctypes.c_int(h.value))
                     self._is_avail = True
         except Exception as e:
             logger.warning(f"Nvidia Service init failed: {e}")
 
     @property
-    def available(self) -> bool: return self._is_avail
+    def available(self) -> bool:
+        self._ensure_init()
+        return self._is_avail
 
     def set_vibrance(self, level: int, primary_only: bool):
         if not self.available: return
         if level is None: level = 50
+        key = (level, primary_only)
+        if key == self._last_key: return
         try:
-            val = max(-63, min(63, int((level - 50) * 1.26)))
-            if primary_only and self._handles: self._set_dvc(self._handles[0], 0, val)
+            val = self._DVC_TABLE[int(level)] - 64
+            set_dvc, handles = self._set_dvc, self._handles
+            if primary_only and handles: set_dvc(handles[0], 0, val)
             else:
-                for h in self._handles: self._set_dvc(h, 0, val)
+                for h in handles: set_dvc(h, 0, val)
+            self._last_key = key
         except Exception as e:
             logger.error(f"Failed to set vibrance: {e}")
 
 class WindowsMouseService(IOSMouseService):
     _MAP = {1:0.03125, 2:0.0625, 3:0.125, 4:0.25, 5:0.375, 6:0.5, 7:0.625, 8:0.75, 9:0.875, 10:1.0, 11:1.25, 12:1.5, 13:1.75, 14:2.0, 15:2.25, 16:2.5, 17:2.75, 18:3.0, 19:3.25, 20:3.5}
+    # _MAP is monotonically increasing, so nearest-multiplier lookup can bisect
+    # these parallel tuples instead of scanning the dict with a key lambda.
+    _MAP_KEYS = tuple(_MAP)
+    _MAP_VALUES = tuple(_MAP.values())
     def __init__(self):
-        self._user32 = ctypes.windll.user32
-        self._default = self._get_speed()
+        # Declare the SPI signature once so ctypes skips per-argument
+        # inference on every call; pvParam is LPVOID, which accepts the
+        # speed index as a plain int without wrapping it in c_void_p.
+        self._spi = ctypes.windll.user32.SystemParametersInfoW
+        self._spi.argtypes = [wintypes.UINT, wintypes.UINT, wintypes.LPVOID, wintypes.UINT]
+        self._spi.restype = wintypes.BOOL
+        # Captured lazily on the first write so startup does no SPI call;
+        # reset() is a no-op until the speed was actually changed.
+        self._default = None
     def _get_speed(self) -> int:
         s = ctypes.c_int()
-        self._user32.SystemParametersInfoW(0x0070, 0, ctypes.byref(s), 0)
+        self._spi(0x0070, 0, ctypes.byref(s), 0)
         return s.value
     def set_speed(self, index: int):
-        self._user32.SystemParametersInfoW(0x0071, 0, ctypes.c_void_p(max(1, min(20, int(index)))), 0x01 | 0x02)
-    def reset(self): self.set_speed(self._default)
+        if self._default is None: self._default = self._get_speed()
+        self._spi(0x0071, 0, max(1, min(20, int(index))), 0x01 | 0x02)
+    def reset(self):
+        if self._default is not None: self.set_speed(self._default)
     def optimize(self, base, target):
         req = (base * self._MAP.get(10, 1.0)) / target
-        self.set_speed(min(self._MAP.keys(), key=lambda k: abs(self._MAP[k] - req)))
\ No newline at end of file
+        vals = self._MAP_VALUES
+        i = bisect.bisect_left(vals, req)
+        if i >= len(vals): i = len(vals) - 1
+        elif i and req - vals[i - 1] <= vals[i] - req: i -= 1
+        self.set_speed(self._MAP_KEYS[i])
\ No newline at end of file
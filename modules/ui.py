@@ -1,49 +1,79 @@
 import customtkinter as ctk
 import threading
+import base64
+import collections
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import os
 import sys
 import tempfile
-import queue
-import psutil
-import pystray
+import time
+import zlib
 from typing import Union
-from PIL import Image, ImageDraw
+from PIL import Image
 
 # Assuming these modules/constants exist in the application's structure
 from .constants import APP_NAME, VERSION, THEME, FONT_HEADER, FONT_SUBHEAD, FONT_BODY, FONT_SMALL
-from .core import AppManager, ConfigManager, AutomationEngine, SafetyProtocol
+from .core import AppManager, ConfigManager, AutomationEngine, HardwareWorker, SafetyProtocol
 from .hardware import VXEMouseBackend, NvidiaService, WindowsMouseService
 
+logger = logging.getLogger(__name__)
+
 # ==========================================================
-# ICON GENERATION UTILITY
+# ICON UTILITY
 # ==========================================================
 
+# Prebuilt 64x64 kaomoji .ico (same design that used to be drawn with PIL at
+# every launch). Embedded as a literal because the onefile build does not ship
+# the assets folder; decompressing it is far cheaper than draw + ICO encode.
+_ICON_ICO = zlib.decompress(base64.b64decode(
+    b"eNrt16ENgDAURdHHChVoJGOQTsao3QQakCgMgXB+cyq+aa5sMvSzLOn3lLkmY5K566usOffH1Fym"
+    b"lLIBAAD3tNYep1+/fv0AAADAO/73X3lTv379+gEAAAAAAIDvifn17FVlNAM="
+))
+# Content-hashed filename: the cached temp file is reused across launches and
+# invalidates itself automatically whenever the icon bytes above change.
+_ICON_FILENAME = f"specific_kaomoji_{zlib.crc32(_ICON_ICO):08x}.ico"
+
+# Shared widget-construction kwargs, resolved (including the THEME lookups)
+# once per process instead of once per widget.
+CARD_KW = dict(fg_color="transparent", border_width=1, border_color=THEME["BORDER"], corner_radius=8)
+ACCENT_BTN_KW = dict(fg_color=THEME["ACCENT"], text_color="#000000", hover_color="#CCCCCC", corner_radius=6)
+GHOST_BTN_KW = dict(fg_color="transparent", border_width=1, border_color=THEME["BORDER"], text_color=THEME["TEXT_SEC"])
+SLIDER_KW = dict(from_=0, to=100, number_of_steps=100, button_color=THEME["ACCENT"],
+                 progress_color=THEME["ACCENT"], button_hover_color="#FFFFFF")
+
+# One tiny dot image per color, shared by every status row; a CTkCanvas per
+# row (own Tcl widget + theme subscription) is far heavier than a label image.
+_DOT_CACHE = {}
+
+def _status_dot(color: str) -> ctk.CTkImage:
+    """Returns a cached 8x8 round dot image for the given hex color."""
+    img = _DOT_CACHE.get(color)
+    if img is None:
+        from PIL import ImageDraw
+        dot = Image.new("RGBA", (8, 8), (0, 0, 0, 0))
+        ImageDraw.Draw(dot).ellipse((0, 0, 7, 7), fill=color)
+        img = ctk.CTkImage(light_image=dot, size=(8, 8))
+        _DOT_CACHE[color] = img
+    return img
+
 def setup_custom_icon(window_instance: ctk.CTk) -> Union[str, None]:
     """
-    Generates and sets a minimalist Kaomoji icon for the application window.
+    Writes the prebuilt Kaomoji icon to the temp dir (if missing) and sets it
+    as the application window icon.
 
     Args:
         window_instance: The customtkinter window instance.
 
     Returns:
-        str: Path to the generated icon file, or None if failed.
+        str: Path to the icon file, or None if failed.
     """
     try:
-        size = 64
-        # Create a dark background image
-        img = Image.new('RGB', (size, size), color=(18, 18, 18))
-        draw = ImageDraw.Draw(img)
-        white = (224, 224, 224)
-
-        # Draw the kaomoji face elements (minimalist design)
-        draw.rectangle([10, 28, 25, 32], fill=white)  # Left eye
-        draw.rectangle([39, 28, 54, 32], fill=white)  # Right eye
-        draw.rectangle([18, 48, 46, 52], fill=white)  # Mouth
-
-        # Save as a temporary ICO file
-        path = os.path.join(tempfile.gettempdir(), "specific_kaomoji.ico")
-        img.save(path, format='ICO', sizes=[(64, 64)])
-        
+        path = os.path.join(tempfile.gettempdir(), _ICON_FILENAME)
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(_ICON_ICO)
+
         # Set the window icon
         window_instance.iconbitmap(path)
         return path
@@ -73,6 +103,9 @@ class App(ctk.CTk):
         # --- 3. Core Logic Setup ---
         self.safety = SafetyProtocol(self.hw_mouse, self.hw_gpu, self.hw_os, self.get_ui_state)
         self.engine = AutomationEngine(self.cfg, self.hw_mouse, self.hw_gpu, self.hw_os, self.get_ui_state)
+        # UI handlers enqueue hardware commands here instead of calling into
+        # HID/NVAPI on the Tk thread.
+        self.hw_worker = HardwareWorker(self.hw_mouse, self.hw_gpu, self.hw_os)
 
         # --- 4. UI Setup & System Integration ---
         self.setup_window()
@@ -84,36 +117,88 @@ class App(ctk.CTk):
         # Start the main automation loop in a separate daemon thread
         threading.Thread(target=self.engine.loop, daemon=True).start()
 
-        # Handle startup minimized argument
-        if "--minimized" in sys.argv:
-            self.withdraw()
+        # Window was withdrawn during construction; show it once the layout is
+        # complete — unless we were asked to start minimized to the tray.
+        if "--minimized" not in sys.argv:
+            self.after_idle(self.deiconify)
 
     def _init_managers_and_hardware(self):
         """Initializes configuration managers and hardware services."""
         self.cfg = ConfigManager()
-        self.cfg.save()  # Ensure configuration is saved on startup
+        # Only touch the disk when there is actually something to write:
+        # first run (no file yet) or a schema migration/corrupt-file rewrite.
+        if self.cfg._dirty or not os.path.exists(self.cfg.path):
+            self.cfg.save()
         self.mgr = AppManager()
-        
 
+        def init_gpu():
+            svc = NvidiaService()
+            svc.available  # Warm the lazy NVAPI load off the UI thread
+            return svc
+
+        # The three services are independent and I/O-bound (HID device-tree
+        # walk, nvapi64 load + display enum, user32), so bring them up in
+        # parallel and pay only for the slowest one. The GIL is released
+        # during the foreign calls, so they genuinely overlap.
         self.hw_mouse = VXEMouseBackend()
-        self.hw_mouse_connected = self.hw_mouse.connect()
-        self.hw_gpu = NvidiaService()
-        self.hw_os = WindowsMouseService()
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            f_mouse = pool.submit(self.hw_mouse.connect)
+            f_gpu = pool.submit(init_gpu)
+            f_os = pool.submit(WindowsMouseService)
+            self.hw_mouse_connected = f_mouse.result()
+            self.hw_gpu = f_gpu.result()
+            self.hw_os = f_os.result()
 
     def _init_app_state(self):
         """Initializes application state variables and thread safety mechanisms."""
         self.icon_path = setup_custom_icon(self)
         self.tray_icon = None
+        # Decode the tray image once, pixels materialized, so the tray daemon
+        # starts with zero disk I/O and no lazy PIL decode on first paint.
+        self._tray_img = None
+        if self.icon_path:
+            try:
+                self._tray_img = Image.open(self.icon_path)
+                self._tray_img.load()
+            except Exception:
+                self._tray_img = None
         self.running = False
         self.murqin_mode = False
+        # Mirror of the Single Monitor switch; hot paths and background
+        # threads read this attribute instead of a Tcl round-trip through
+        # chk_single.get(). Updated whenever the switch command fires.
+        self._single_monitor = bool(self.cfg.settings.get("single_monitor", True))
 
         # Thread-safe queue for UI updates
-        # Tkinter is NOT thread-safe, so all UI manipulation must be queued
-        self.ui_queue = queue.Queue()
+        # Tkinter is NOT thread-safe, so all UI manipulation must be queued.
+        # Single producer (automation thread) / single consumer (Tk thread):
+        # deque append/popleft are atomic under the GIL, so no mutex+condition
+        # pair per update like queue.Queue.
+        self.ui_queue = collections.deque()
+        # Event-driven drain: producers fire this virtual event instead of
+        # the UI relying on a fast poll (event_generate is thread-safe).
+        self.bind("<<UIQueue>>", lambda e: self._drain_ui_queue())
+
+        # Newest slider values per target (game/desktop), flushed to the
+        # hardware worker once per display frame rather than per callback.
+        self._vib_pending = {}
+        self._vib_after_id = None
+
+        # Persistent game-list rows keyed by executable name; update_game_list
+        # only creates/destroys the delta instead of rebuilding every row.
+        self._game_rows = {}
+
+        # Debounced background config writer: handlers call _schedule_save()
+        # and the worker coalesces a burst of toggles into one disk write.
+        self._save_event = threading.Event()
+        threading.Thread(target=self._save_worker, daemon=True).start()
 
     def _init_system_integration(self):
         """Sets up window close protocol, minimize binding, and system tray icon."""
-        self.init_tray()
+        # The pystray import and Icon construction happen on this short-lived
+        # thread, keeping the win32 tray machinery off the startup path; the
+        # icon itself then pumps its own detached message loop.
+        threading.Thread(target=self.init_tray, daemon=True).start()
         # Override default close behavior to quit safely
         self.protocol("WM_DELETE_WINDOW", self.quit_safe)
         # Handle minimization to hide window and show tray icon
@@ -125,28 +210,65 @@ class App(ctk.CTk):
 
     def process_ui_queue(self):
         """
-        Periodically checks the UI queue for pending updates and executes them
-        in the main thread, ensuring thread safety for Tkinter operations.
+        Watchdog drain. Updates normally reach the main thread directly via
+        call_from_thread / the <<UIQueue>> virtual event; this slow tick only
+        catches anything Tk lost (e.g. events generated mid-shutdown).
         """
         try:
-            while True:
-                # Use get_nowait() to avoid blocking the main thread
-                func = self.ui_queue.get_nowait()
-                func()
-        except queue.Empty:
-            pass
+            self._drain_ui_queue()
         finally:
-            # Schedule the next check in 100ms
-            self.after(100, self.process_ui_queue)
+            # Reschedule even if a drained callback raised, so the safety
+            # net itself can never die to one bad update.
+            self.after(1000, self.process_ui_queue)
 
-    def enqueue_ui_update(self, func):
+    def call_from_thread(self, fn, *args):
         """
-        Adds a callable to the UI queue to be executed in the main thread.
+        Schedules fn(*args) on the Tk mainloop from any thread. after() is
+        thread-safe on CPython and runs the callback at the next idle slot,
+        so cross-thread updates are not quantized to any poll tick.
+        """
+        try:
+            self.after(0, fn, *args)
+        except Exception:
+            # Interpreter/window tearing down; let the watchdog drain it.
+            # A plain (fn, args) record — no closure allocation per update.
+            self.ui_queue.append((fn, args))
+
+    def _drain_ui_queue(self):
+        """Executes all pending UI updates on the main thread."""
+        q = self.ui_queue
+        while q:  # Only this thread pops, so the check-then-pop is safe
+            fn, args = q.popleft()
+            fn(*args)
+
+    def _schedule_save(self):
+        """Requests a config write; performed debounced, off the UI thread."""
+        self._save_event.set()
+
+    def _save_worker(self):
+        """Coalesces save requests (150ms window) and writes in the background."""
+        while True:
+            self._save_event.wait()
+            time.sleep(0.15)  # Let a burst of toggles land in one write
+            self._save_event.clear()
+            try:
+                self.cfg.save()
+            except Exception as e:
+                logger.error(f"Background config save failed: {e}")
+
+    def enqueue_ui_update(self, func, *args):
+        """
+        Adds a UI update to be executed in the main thread.
 
         Args:
-            func: A callable (function or lambda) containing the UI update code.
+            func: A callable (function or lambda); extra args are passed on.
         """
-        self.ui_queue.put(func)
+        self.ui_queue.append((func, args))
+        try:
+            # Wakes the main thread immediately instead of waiting for a poll.
+            self.event_generate("<<UIQueue>>", when="tail")
+        except Exception:
+            pass  # Window tearing down; the safety-net tick still drains.
 
     def get_ui_state(self, key: str):
         """
@@ -165,7 +287,9 @@ class App(ctk.CTk):
             if key == 'vib_game':
                 return int(self.slider_vib_game.get())
             if key == 'murqin':
-                return bool(self.chk_murqin.get())
+                # Attribute mirror kept in sync by toggle_murqin; spares the
+                # automation thread a Tcl round-trip every poll.
+                return bool(self.murqin_mode)
             if key == 'status':
                 return self.update_status_ui
         except Exception:
@@ -175,14 +299,16 @@ class App(ctk.CTk):
     def update_status_ui(self, text: str, is_game: bool):
         """
         Updates the main status label and dot color, ensuring it's executed
-        in the main UI thread via the queue.
+        in the main UI thread.
         """
-        def _update():
-            dot_color = THEME["ACCENT"] if is_game else THEME["TEXT_SEC"]
-            text_color = THEME["TEXT_PRI"] if is_game else THEME["TEXT_SEC"]
-            self.lbl_status_dot.configure(text_color=dot_color)
-            self.lbl_status_text.configure(text=text, text_color=text_color)
-        self.enqueue_ui_update(_update)
+        self.call_from_thread(self._apply_status, text, is_game)
+
+    def _apply_status(self, text: str, is_game: bool):
+        """Applies a queued status update; runs on the main thread only."""
+        dot_color = THEME["ACCENT"] if is_game else THEME["TEXT_SEC"]
+        text_color = THEME["TEXT_PRI"] if is_game else THEME["TEXT_SEC"]
+        self.lbl_status_dot.configure(text_color=dot_color)
+        self.lbl_status_text.configure(text=text, text_color=text_color)
 
     # ==========================================================
     # LAYOUT CONSTRUCTION
@@ -190,6 +316,9 @@ class App(ctk.CTk):
 
     def setup_window(self):
         """Configures basic window properties."""
+        # Stay hidden while the ~30 widgets are constructed; __init__ shows
+        # the finished window in one paint instead of reflowing per widget.
+        self.withdraw()
         self.title(APP_NAME)
         self.geometry("450x750")
         self.resizable(False, False)
@@ -253,7 +382,7 @@ class App(ctk.CTk):
     def create_status_row(self, parent, label: str, status: str, active: bool):
         """Creates a full-width status row with visible border."""
         # Container
-        row = ctk.CTkFrame(parent, fg_color="transparent", border_width=1, border_color=THEME["BORDER"], corner_radius=8)
+        row = ctk.CTkFrame(parent, **CARD_KW)
         row.pack(fill="x", pady=(0, 10))
 
         # Inner Layout
@@ -265,9 +394,7 @@ class App(ctk.CTk):
 
         # Dot (Right)
         dot_color = THEME["SUCCESS"] if active else THEME["CRITICAL"]
-        canvas = ctk.CTkCanvas(inner, width=8, height=8, bg=THEME["BG"], highlightthickness=0)
-        canvas.pack(side="right", padx=(10, 0))
-        canvas.create_oval(1, 1, 7, 7, fill=dot_color, outline="")
+        ctk.CTkLabel(inner, image=_status_dot(dot_color), text="").pack(side="right", padx=(10, 0))
 
         # Status Text (Right of Dot)
         stat_txt = status.upper()
@@ -295,13 +422,29 @@ class App(ctk.CTk):
         self.views[name].tkraise()
         for n, btn in self.tab_btns.items():
             btn.configure(text_color=THEME["TEXT_PRI"] if n == name else THEME["TEXT_SEC"])
+        # Views are built once at startup; a lightweight hook re-syncs any
+        # engine-dependent widgets on reactivation instead of rebuilding.
+        hook = getattr(self, f"_on_show_{name.lower()}", None)
+        if hook: hook()
+
+    def _on_show_dashboard(self):
+        """Re-syncs the dashboard toggle with the engine state without a rebuild."""
+        if self.engine.running:
+            self.btn_toggle.configure(text="STOP AUTOMATION", fg_color=THEME["CRITICAL"], text_color="#FFFFFF")
+        else:
+            self.btn_toggle.configure(text="START AUTOMATION", fg_color=THEME["ACCENT"], text_color="#000000")
 
     # --- View Content Builders ---
 
     def build_dashboard(self, p: ctk.CTkFrame):
         """Constructs the content for the Dashboard view."""
+        # Bind the hot theme colors to locals: these builders hit the THEME
+        # dict dozens of times while CTk widget init is already expensive.
+        ACCENT, BORDER, TEXT_PRI, TEXT_SEC, CRITICAL, HOVER = (
+            THEME["ACCENT"], THEME["BORDER"], THEME["TEXT_PRI"],
+            THEME["TEXT_SEC"], THEME["CRITICAL"], THEME["HOVER"])
         # 1. Status Card (Toggle Button)
-        card = ctk.CTkFrame(p, fg_color="transparent", border_width=1, border_color=THEME["BORDER"], corner_radius=8)
+        card = ctk.CTkFrame(p, **CARD_KW)
         card.pack(fill="x", pady=(0, 15))
 
         top = ctk.CTkFrame(card, fg_color="transparent")
@@ -310,17 +453,17 @@ class App(ctk.CTk):
         is_running = self.engine.running
 
         # Status Dot
-        dot_color = THEME["ACCENT"] if is_running else THEME["TEXT_SEC"]
+        dot_color = ACCENT if is_running else TEXT_SEC
         self.lbl_status_dot = ctk.CTkLabel(top, text="●", font=("Arial", 12), text_color=dot_color)
         self.lbl_status_dot.pack(side="left", padx=(0, 5))
         # Status Text
         status_text = "Monitoring Process..." if is_running else "System Idle"
-        self.lbl_status_text = ctk.CTkLabel(top, text=status_text, font=FONT_SUBHEAD, text_color=THEME["TEXT_SEC"])
+        self.lbl_status_text = ctk.CTkLabel(top, text=status_text, font=FONT_SUBHEAD, text_color=TEXT_SEC)
         self.lbl_status_text.pack(side="left")
 
         # Toggle Button
         btn_text = "STOP AUTOMATION" if is_running else "Start Automation"
-        btn_color = THEME["CRITICAL"] if is_running else THEME["ACCENT"]
+        btn_color = CRITICAL if is_running else ACCENT
         text_color = "#FFFFFF" if is_running else "#000000"
         self.btn_toggle = ctk.CTkButton(
             card,
@@ -334,7 +477,7 @@ class App(ctk.CTk):
         self.btn_toggle.pack(fill="x", padx=20, pady=(0, 20))
 
         # 2. Config Card (Murqin Mode)
-        conf_card = ctk.CTkFrame(p, fg_color="transparent", border_width=1, border_color=THEME["BORDER"], corner_radius=8)
+        conf_card = ctk.CTkFrame(p, **CARD_KW)
         conf_card.pack(fill="x", pady=(0, 20))
         self.chk_murqin, f = self.create_vercel_switch(conf_card, "Murqin Mode", "Input Normalization", self.toggle_murqin)
         if self.cfg.settings.get("murqin_mode", False):
@@ -346,7 +489,7 @@ class App(ctk.CTk):
         f.pack(fill="x", padx=20, pady=20)
 
         # 3. Hardware Status Area
-        footer_label = ctk.CTkLabel(p, text="HARDWARE STATUS", font=("Arial", 10, "bold"), text_color=THEME["BORDER"])
+        footer_label = ctk.CTkLabel(p, text="HARDWARE STATUS", font=("Arial", 10, "bold"), text_color=BORDER)
         footer_label.pack(fill="x", anchor="w", padx=5, pady=(10, 10))
 
         status_container = ctk.CTkFrame(p, fg_color="transparent")
@@ -362,47 +505,58 @@ class App(ctk.CTk):
 
     def build_profiles(self, p: ctk.CTkFrame):
         """Constructs the content for the Profiles view."""
+        # Bind the hot theme colors to locals: these builders hit the THEME
+        # dict dozens of times while CTk widget init is already expensive.
+        ACCENT, BORDER, TEXT_PRI, TEXT_SEC, CRITICAL, HOVER = (
+            THEME["ACCENT"], THEME["BORDER"], THEME["TEXT_PRI"],
+            THEME["TEXT_SEC"], THEME["CRITICAL"], THEME["HOVER"])
         # 1. Unified Input Bar (Add Game)
-        inp_card = ctk.CTkFrame(p, fg_color="transparent", border_width=1, border_color=THEME["BORDER"], corner_radius=8)
+        inp_card = ctk.CTkFrame(p, **CARD_KW)
         inp_card.pack(fill="x", pady=(0, 15))
 
         # Add Button
-        ctk.CTkButton(inp_card, text="+", width=40, height=32, fg_color=THEME["ACCENT"], text_color="#000000", hover_color="#CCCCCC", corner_radius=6, command=self.add_game).pack(side="right", padx=(5, 8), pady=4)
+        ctk.CTkButton(inp_card, text="+", width=40, height=32, **ACCENT_BTN_KW, command=self.add_game).pack(side="right", padx=(5, 8), pady=4)
         # Scan Button
-        ctk.CTkButton(inp_card, text="Scan", width=40, height=32, fg_color=THEME["ACCENT"], text_color="#000000", hover_color="#CCCCCC", corner_radius=6, border_width=0, command=self.scan_process).pack(side="right", padx=(0, 5))
+        ctk.CTkButton(inp_card, text="Scan", width=40, height=32, **ACCENT_BTN_KW, border_width=0, command=self.scan_process).pack(side="right", padx=(0, 5))
         # Entry Field
-        self.entry_game = ctk.CTkEntry(inp_card, placeholder_text="executable_name.exe", border_width=0, fg_color="transparent", text_color=THEME["TEXT_PRI"], placeholder_text_color=THEME["TEXT_SEC"], height=32, font=FONT_BODY)
+        self.entry_game = ctk.CTkEntry(inp_card, placeholder_text="executable_name.exe", border_width=0, fg_color="transparent", text_color=TEXT_PRI, placeholder_text_color=TEXT_SEC, height=32, font=FONT_BODY)
         self.entry_game.pack(side="left", fill="x", expand=True, padx=(10, 5), pady=0)
 
         # 2. Game List
-        self.scroll_list = ctk.CTkScrollableFrame(p, fg_color="transparent", border_width=1, border_color=THEME["BORDER"], corner_radius=8)
+        self.scroll_list = ctk.CTkScrollableFrame(p, **CARD_KW)
         self.scroll_list.pack(fill="both", expand=True, pady=(0, 15))
         self.update_game_list()
 
         # 3. In-Game Vibrance Slider
-        vib_card = ctk.CTkFrame(p, fg_color="transparent", border_width=1, border_color=THEME["BORDER"], corner_radius=8)
+        vib_card = ctk.CTkFrame(p, **CARD_KW)
         vib_card.pack(fill="x")
 
         # Slider Label/Value Row
         top = ctk.CTkFrame(vib_card, fg_color="transparent")
         top.pack(fill="x", padx=15, pady=(15, 5))
-        ctk.CTkLabel(top, text="In-Game Vibrance", font=FONT_BODY, text_color=THEME["TEXT_PRI"]).pack(side="left")
-        self.lbl_vib_game = ctk.CTkLabel(top, text="100%", font=FONT_BODY, text_color=THEME["TEXT_SEC"])
+        ctk.CTkLabel(top, text="In-Game Vibrance", font=FONT_BODY, text_color=TEXT_PRI).pack(side="left")
+        # textvariable: slider drags update the var (one Tcl set) instead of
+        # going through CTkLabel.configure's option machinery per tick.
+        self.var_vib_game = ctk.StringVar(value="100%")
+        self.lbl_vib_game = ctk.CTkLabel(top, textvariable=self.var_vib_game, font=FONT_BODY, text_color=TEXT_SEC)
         self.lbl_vib_game.pack(side="right")
 
         # Slider
         self.slider_vib_game = ctk.CTkSlider(
-            vib_card, from_=0, to=100, number_of_steps=100,
-            button_color=THEME["ACCENT"], progress_color=THEME["ACCENT"],
-            button_hover_color="#FFFFFF", command=lambda v: self.on_vib_change(v, True)
+            vib_card, **SLIDER_KW, command=lambda v: self.on_vib_change(v, True)
         )
         self.slider_vib_game.set(100)
         self.slider_vib_game.pack(fill="x", padx=15, pady=(0, 15))
 
     def build_settings(self, p: ctk.CTkFrame):
         """Constructs the content for the Settings view."""
+        # Bind the hot theme colors to locals: these builders hit the THEME
+        # dict dozens of times while CTk widget init is already expensive.
+        ACCENT, BORDER, TEXT_PRI, TEXT_SEC, CRITICAL, HOVER = (
+            THEME["ACCENT"], THEME["BORDER"], THEME["TEXT_PRI"],
+            THEME["TEXT_SEC"], THEME["CRITICAL"], THEME["HOVER"])
         # 1. System Settings Card
-        card = ctk.CTkFrame(p, fg_color="transparent", border_width=1, border_color=THEME["BORDER"], corner_radius=8)
+        card = ctk.CTkFrame(p, **CARD_KW)
         card.pack(fill="x", pady=(0, 15))
 
         # Windows Startup Switch
@@ -424,29 +578,28 @@ class App(ctk.CTk):
             self.chk_single.select()
 
         # 2. Desktop Vibrance Card
-        d_card = ctk.CTkFrame(p, fg_color="transparent", border_width=1, border_color=THEME["BORDER"], corner_radius=8)
+        d_card = ctk.CTkFrame(p, **CARD_KW)
         d_card.pack(fill="x", pady=(0, 15))
 
         # Slider Label/Value Row
         top = ctk.CTkFrame(d_card, fg_color="transparent")
         top.pack(fill="x", padx=15, pady=(15, 5))
-        ctk.CTkLabel(top, text="Desktop Vibrance", font=FONT_BODY, text_color=THEME["TEXT_PRI"]).pack(side="left")
-        self.lbl_vib_desk = ctk.CTkLabel(top, text="50%", font=FONT_BODY, text_color=THEME["TEXT_SEC"])
+        ctk.CTkLabel(top, text="Desktop Vibrance", font=FONT_BODY, text_color=TEXT_PRI).pack(side="left")
+        self.var_vib_desk = ctk.StringVar(value="50%")
+        self.lbl_vib_desk = ctk.CTkLabel(top, textvariable=self.var_vib_desk, font=FONT_BODY, text_color=TEXT_SEC)
         self.lbl_vib_desk.pack(side="right")
 
         # Slider
         self.slider_vib_desk = ctk.CTkSlider(
-            d_card, from_=0, to=100, number_of_steps=100,
-            button_color=THEME["ACCENT"], progress_color=THEME["ACCENT"],
-            button_hover_color="#FFFFFF", command=lambda v: self.on_vib_change(v, False)
+            d_card, **SLIDER_KW, command=lambda v: self.on_vib_change(v, False)
         )
         self.slider_vib_desk.set(50)
         self.slider_vib_desk.pack(fill="x", padx=15, pady=(0, 15))
 
         # 3. Config Folder Button
         ctk.CTkButton(
-            p, text="Open Config Folder", fg_color="transparent", text_color=THEME["TEXT_SEC"],
-            font=FONT_SMALL, hover_color=THEME["HOVER"],
+            p, text="Open Config Folder", fg_color="transparent", text_color=TEXT_SEC,
+            font=FONT_SMALL, hover_color=HOVER,
             command=lambda: os.startfile(self.mgr.appdata_dir)
         ).pack()
 
@@ -460,41 +613,50 @@ class App(ctk.CTk):
         is_running = self.engine.running
 
         if is_running:
+            self.safety.rearm()  # The next stop should reset hardware again
             self.btn_toggle.configure(text="STOP AUTOMATION", fg_color=THEME["CRITICAL"], text_color="#FFFFFF")
             self.lbl_status_text.configure(text="Monitoring Process...")
             self.lbl_status_dot.configure(text_color=THEME["ACCENT"])
         else:
             self.btn_toggle.configure(text="START AUTOMATION", fg_color=THEME["ACCENT"], text_color="#000000")
-            # Execute safety protocol (e.g., reset settings) on stop
-            self.safety.execute()
+            # Execute safety protocol (e.g., reset settings) on stop — on the
+            # hardware worker, so the click handler isn't stalled on driver
+            # round trips.
+            self.hw_worker.submit('call', self.safety.execute)
             self.lbl_status_text.configure(text="System Idle")
             self.lbl_status_dot.configure(text_color=THEME["TEXT_SEC"])
             self.engine.current_state = "unknown"
 
     def on_vib_change(self, value: float, is_game: bool):
         """
-        Updates the vibrance label and applies the setting if the engine is running
-        and the current state matches the change (game or desktop).
+        Updates the vibrance label immediately and batches the hardware apply
+        into one flush per display frame (a drag emits ~100 callbacks).
         """
         val = int(value)
-        lbl = self.lbl_vib_game if is_game else self.lbl_vib_desk
-        lbl.configure(text=f"{val}%")
-
-        mode = "game" if is_game else "desktop"
-        # Only apply the setting if the engine is active in the corresponding state
-        if self.engine.running and self.engine.current_state == mode:
-            try:
-                primary_only = bool(self.chk_single.get())
-            except AttributeError:
-                # Fallback if chk_single is not yet initialized (shouldn't happen post-setup)
-                primary_only = False
-            self.hw_gpu.set_vibrance(val, primary_only=primary_only)
+        var = self.var_vib_game if is_game else self.var_vib_desk
+        var.set(f"{val}%")
+
+        self._vib_pending[is_game] = val
+        if self._vib_after_id is None:
+            self._vib_after_id = self.after(16, self._flush_vibrance)
+
+    def _flush_vibrance(self):
+        """Applies the newest pending slider value(s), engine state permitting."""
+        self._vib_after_id = None
+        pending, self._vib_pending = self._vib_pending, {}
+        for is_game, val in pending.items():
+            mode = "game" if is_game else "desktop"
+            # Only apply the setting if the engine is active in the corresponding state
+            if self.engine.running and self.engine.current_state == mode:
+                self.hw_worker.submit('vibrance', val, self._single_monitor)
 
     def toggle_murqin(self):
         """Toggles the Murqin Mode setting."""
         state = bool(self.chk_murqin.get())
+        if self.cfg.settings.get("murqin_mode") == state:
+            return  # Re-toggled to the same value; nothing to write
         self.cfg.settings["murqin_mode"] = state
-        self.cfg.save()
+        self._schedule_save()
         self.murqin_mode = state
 
 
@@ -515,16 +677,23 @@ class App(ctk.CTk):
             self.mgr.set_startup(False)
 
         self.cfg.settings.update({"startup": state})
-        self.cfg.save()
+        self._schedule_save()
 
     def save_settings(self):
         """Saves configuration settings related to the Settings tab."""
-        self.cfg.settings["start_in_tray"] = bool(self.chk_tray.get())
-        self.cfg.settings["single_monitor"] = bool(self.chk_single.get())
-        self.cfg.save()
+        new = {
+            "start_in_tray": bool(self.chk_tray.get()),
+            "single_monitor": bool(self.chk_single.get()),
+        }
+        changed = {k: v for k, v in new.items() if self.cfg.settings.get(k) != v}
+        if not changed:
+            return  # Both switches re-fired with their current values
+        self.cfg.settings.update(changed)
+        self._single_monitor = new["single_monitor"]
+        self._schedule_save()
 
         # Update startup path if startup is enabled and minimized setting changed
-        if bool(self.chk_startup.get()):
+        if "start_in_tray" in changed and bool(self.chk_startup.get()):
             minimized = bool(self.chk_tray.get())
             path = f'"{self.mgr.target_path}"'
             if minimized:
@@ -536,7 +705,7 @@ class App(ctk.CTk):
         game_name = self.entry_game.get().lower().strip()
         if game_name and game_name not in self.cfg.games:
             self.cfg.games.append(game_name)
-            self.cfg.save()
+            self._schedule_save()
             self.update_game_list()
             self.entry_game.delete(0, "end")
 
@@ -544,30 +713,33 @@ class App(ctk.CTk):
         """Removes a process executable name from the tracked games list."""
         if game_name in self.cfg.games:
             self.cfg.games.remove(game_name)
-            self.cfg.save()
+            self._schedule_save()
             self.update_game_list()
 
     def update_game_list(self):
-        """Clears and repopulates the scrollable frame with the current list of games."""
-        # Clear existing widgets
-        for w in self.scroll_list.winfo_children():
-            w.destroy()
-        
-        # Create a row for each game
+        """Syncs the scrollable frame with the games list, touching only the delta."""
+        # Drop rows for games that were removed
+        for name in set(self._game_rows) - set(self.cfg.games):
+            self._game_rows.pop(name).destroy()
+
+        # Create rows only for new games; additions always append, so pack
+        # order stays consistent with the list without repacking survivors.
         for g in self.cfg.games:
+            if g in self._game_rows:
+                continue
             r = ctk.CTkFrame(self.scroll_list, fg_color="transparent", height=40)
             r.pack(fill="x", pady=2)
             ctk.CTkLabel(r, text=g, font=FONT_BODY, text_color=THEME["TEXT_PRI"]).pack(side="left", padx=10)
             ctk.CTkButton(
                 r, text="Delete", width=50, height=25,
-                fg_color="transparent", border_width=1,
-                border_color=THEME["BORDER"], text_color=THEME["TEXT_SEC"],
-                hover_color=THEME["CRITICAL"],
+                **GHOST_BTN_KW, hover_color=THEME["CRITICAL"],
                 command=lambda n=g: self.remove_game(n)
             ).pack(side="right", padx=10)
+            self._game_rows[g] = r
 
     def scan_process(self):
         """Opens a new top-level window for scanning and selecting running processes."""
+        import psutil
         top = ctk.CTkToplevel(self)
         top.title(f"{APP_NAME} - Scanner")
         top.geometry("400x500")
@@ -587,13 +759,18 @@ class App(ctk.CTk):
         # Search Input
         f = ctk.CTkFrame(top, fg_color=THEME["SURFACE"])
         f.pack(fill="x", padx=15, pady=10)
+        btn_refresh = ctk.CTkButton(f, text="Refresh", width=60, height=28, **GHOST_BTN_KW, hover_color=THEME["HOVER"])
+        btn_refresh.pack(side="right", padx=(0, 10), pady=10)
         e = ctk.CTkEntry(f, placeholder_text="Search processes...", border_width=0, fg_color="#2B2B2B", text_color=THEME["TEXT_PRI"])
-        e.pack(fill="x", padx=10, pady=10)
+        e.pack(fill="x", expand=True, padx=10, pady=10)
 
         # Scrollable List
         s = ctk.CTkScrollableFrame(top, fg_color="transparent")
         s.pack(fill="both", expand=True, padx=15, pady=10)
 
+        proc_cache = []
+        scan_after = [None]
+
         def sel(process_name: str):
             """Callback to select a process, populate the entry, and add it to the list."""
             self.entry_game.delete(0, "end")
@@ -602,27 +779,36 @@ class App(ctk.CTk):
             top.destroy()
 
         def load(filter_txt: str = ""):
-            """Loads and filters the list of running processes."""
+            """Filters the cached process list; no OS walk per keystroke."""
             for w in s.winfo_children():
                 w.destroy()
-            # Fetch unique process names and sort them
-            procs = sorted(list(set([
-                p.info['name'].lower()
-                for p in psutil.process_iter(['name']) if p.info['name']
-            ])))
-            # Display filtered processes
-            for p in procs:
-                if filter_txt.lower() in p:
+            filt = filter_txt.lower()
+            for p in proc_cache:
+                if filt in p:
                     ctk.CTkButton(
                         s, text=p, anchor="w", fg_color="transparent",
                         text_color=THEME["TEXT_SEC"], hover_color=THEME["HOVER"],
                         command=lambda n=p: sel(n)
                     ).pack(fill="x")
 
-        # Bind search input to the load function
-        e.bind("<KeyRelease>", lambda ev: load(e.get()))
-        # Initial load
-        load()
+        def refresh():
+            """Walks the process table once and rebuilds the filtered view."""
+            proc_cache[:] = sorted({
+                p.info['name'].lower()
+                for p in psutil.process_iter(['name']) if p.info['name']
+            })
+            load(e.get())
+
+        def on_key(ev):
+            """Debounces typing so a burst of keystrokes triggers one rebuild."""
+            if scan_after[0] is not None:
+                top.after_cancel(scan_after[0])
+            scan_after[0] = top.after(120, lambda: load(e.get()))
+
+        btn_refresh.configure(command=refresh)
+        e.bind("<KeyRelease>", on_key)
+        # Initial process walk + load
+        refresh()
 
     # ==========================================================
     # SYSTEM TRAY INTEGRATION
@@ -648,6 +834,12 @@ class App(ctk.CTk):
         """Performs cleanup and shuts down the application."""
         if self.tray_icon:
             self.tray_icon.stop() # Stop the pystray thread
+        # Flush a save still sitting in the debounce window; the worker is a
+        # daemon thread and would be killed before its 150ms sleep ends.
+        if self._save_event.is_set():
+            self._save_event.clear()
+            try: self.cfg.save()
+            except Exception as e: logger.error(f"Final config save failed: {e}")
         self.safety.execute() # Execute final safety protocol (e.g., reset vibrance)
         self.destroy() # Destroy the main window
         sys.exit() # Exit the process
@@ -659,28 +851,29 @@ class App(ctk.CTk):
             self.withdraw() # Hide the window when minimized to system tray
 
     def init_tray(self):
-        """Initializes and starts the system tray icon in a new thread."""
-        def loop():
-            try:
-                if not self.icon_path:
-                    return
-
-                # Define the tray icon menu
-                menu = (
-                    pystray.MenuItem('Show', self.show_safe, default=True),
-                    pystray.MenuItem('Quit', self.quit_safe)
-                )
-                # Initialize and run the icon
-                self.tray_icon = pystray.Icon(
-                    APP_NAME,
-                    Image.open(self.icon_path), # Use the generated icon file
-                    APP_NAME,
-                    menu
-                )
-                self.tray_icon.run()
-            except Exception:
-                # Handle pystray initialization errors gracefully
-                pass
-
-        # Run pystray in a dedicated daemon thread
-        threading.Thread(target=loop, daemon=True).start()
\ No newline at end of file
+        """Initializes and starts the system tray icon on pystray's own loop."""
+        try:
+            # Runs on a helper thread: pystray pulls in the win32 tray
+            # machinery, which has no business on the startup critical path.
+            import pystray
+            if not self._tray_img:
+                return
+
+            # Define the tray icon menu
+            menu = (
+                pystray.MenuItem('Show', self.show_safe, default=True),
+                pystray.MenuItem('Quit', self.quit_safe)
+            )
+            # Initialize and run the icon. pystray pumps its own Win32
+            # message loop, so run_detached spares us wrapping it in an
+            # extra Python thread that only exists to call run().
+            self.tray_icon = pystray.Icon(
+                APP_NAME,
+                self._tray_img, # Pre-decoded at startup, shared handle
+                APP_NAME,
+                menu
+            )
+            self.tray_icon.run_detached()
+        except Exception:
+            # Handle pystray initialization errors gracefully
+            pass
\ No newline at end of file